@@ -1,8 +1,14 @@
 import sys
-import pyttsx3
-import sounddevice as sd
+import os
+import re
+import string
+import hashlib
+import heapq
+import itertools
+import numpy as np
 import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from PyQt5.QtWidgets import (
     QApplication, QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QLabel,
@@ -29,12 +35,19 @@ class Announcement:
         self.voice_id = voice_id
         self.priority = priority
         self.variables = variables or {}
+        # Parse the template once; str.format re-parses the mini-language on
+        # every call, which adds up for daily/weekly repeats.
+        try:
+            self._parsed = list(string.Formatter().parse(text_template))
+        except Exception:
+            self._parsed = None  # malformed template, fall back to raw text
 
     def get_text(self):
-        try:
-            return self.text_template.format(**self.variables)
-        except Exception as e:
-            return self.text_template  # fallback if variables missing
+        if self._parsed is None:
+            return self.text_template
+        return ''.join(
+            lit + (str(self.variables.get(field, '{' + field + '}')) if field else '')
+            for lit, field, _, _ in self._parsed)
 
     def is_due(self, now):
         return now >= self.play_time
@@ -47,65 +60,224 @@ class Announcement:
             self.play_time += timedelta(weeks=1)
 
 # ---------------- Queue Manager ----------------
+WAV_CACHE_DIR = "wav_cache"
+WAV_CACHE_MAX = 128  # rendered files kept before evicting the oldest
+
+
 class AnnouncementQueue:
     def __init__(self, engine, voices, status_bar):
-        self.queue = []
+        self.queue = []  # heap of (-priority, play_time, seq, announcement)
         self.current_announcement = None
         self.engine = engine
         self.voices = voices
         self.status_bar = status_bar
         self.lock = threading.Lock()
-        self.playing_thread = None
+        # Persistent playback worker: submitting to an idle executor is far
+        # cheaper than spawning a fresh thread (and stack) per announcement.
+        self._play_pool = ThreadPoolExecutor(max_workers=1)
+        self._play_future = None
         self.interrupted = False
+        self._seq = itertools.count()  # tie-breaker so announcements never compare
+        # Single synthesis worker: renders announcement N+1 while N plays
+        self._synth_pool = ThreadPoolExecutor(max_workers=1)
+        self._ahead_future = None
+        self._ahead_announcement = None
+        self._play_stream = None
+        self._wav_cache = {}  # (voice_id, text) -> rendered wav path
+        # SoA mirror of the heap's scheduling attributes for vectorized
+        # due-time scans; rebuilt lazily whenever the heap has changed.
+        # Every heap mutation (push and pop) happens under self.lock and
+        # sets _soa_dirty there, so a clean mirror always matches the heap.
+        self._play_us = np.empty(0, dtype=np.int64)
+        self._prio = np.empty(0, dtype=np.int8)
+        self._soa_dirty = False
+        # Cancel in-progress synthesis cooperatively: the callback runs inside
+        # the driver's own loop, so engine.stop() there is race-free (calling
+        # it from another thread can deadlock the SAPI driver).
+        self._word_token = engine.connect('started-word', self._on_word)
+        # Rate/volume never change per-announcement; set them once. Voice is
+        # only switched when it differs from the last one used (each
+        # setProperty('voice') is a COM round-trip on Windows).
+        self._last_voice_id = None
+        engine.setProperty('rate', 150)
+        engine.setProperty('volume', 1.0)
+
+    def _on_word(self, name, location, length):
+        if self.interrupted:
+            self.engine.stop()
+
+    def _make_entry(self, announcement):
+        # Built outside the lock so the critical section is just the heap push
+        # (itertools.count is safe to advance without the lock).
+        return (-announcement.priority, announcement.play_time, next(self._seq), announcement)
 
     def add_announcement(self, announcement: Announcement):
+        entry = self._make_entry(announcement)
         with self.lock:
-            self.queue.append(announcement)
-            # Sort by priority descending and play_time ascending
-            self.queue.sort(key=lambda a: (-a.priority, a.play_time))
+            # Heap keyed on priority descending, then play_time ascending
+            heapq.heappush(self.queue, entry)
+            self._soa_dirty = True
         self.status_bar.showMessage(f"Announcement queued: {announcement.get_text()}")
         self._try_play_next()
 
     def interrupt_with_live(self, announcement: Announcement):
+        entry = self._make_entry(announcement)
         with self.lock:
             # Interrupt current announcement
-            if self.playing_thread and self.playing_thread.is_alive():
+            if self._play_future is not None and not self._play_future.done():
                 self.interrupted = True
-                self.engine.stop()  # stop current TTS immediately
-            # Put live announcement at front of queue
-            self.queue.insert(0, announcement)
+                if self._play_stream is not None:
+                    self._play_stream.abort()  # stop playback immediately
+            # Live announcements carry the highest priority, so they pop first
+            heapq.heappush(self.queue, entry)
+            self._soa_dirty = True
         self.status_bar.showMessage("Live announcement started...")
         self._try_play_next()
 
     def _try_play_next(self):
-        if self.playing_thread and self.playing_thread.is_alive():
-            return  # Already playing
-        if not self.queue:
-            return
-        next_ann = self.queue.pop(0)
-        self.current_announcement = next_ann
-        self.interrupted = False
-        self.playing_thread = threading.Thread(target=self._play_announcement, args=(next_ann,), daemon=True)
-        self.playing_thread.start()
+        # The pop must hold the same lock as the pushes: a heappop sift-down
+        # interleaving with a concurrent heappush can corrupt the heap.
+        with self.lock:
+            if self._play_future is not None and not self._play_future.done():
+                return  # Already playing
+            if not self.queue:
+                return
+            _, _, _, next_ann = heapq.heappop(self.queue)
+            self._soa_dirty = True
+            self.current_announcement = next_ann
+            self.interrupted = False
+            self._play_future = self._play_pool.submit(self._play_announcement, next_ann)
+
+    def _rebuild_soa(self):
+        """Mirror the heap's play_time/priority into contiguous arrays (lock held)."""
+        n = len(self.queue)
+        self._play_us = np.fromiter(
+            (int(entry[1].timestamp() * 1e6) for entry in self.queue),
+            dtype=np.int64, count=n)
+        self._prio = np.fromiter(
+            (-entry[0] for entry in self.queue), dtype=np.int8, count=n)
+        self._soa_dirty = False
+
+    def poll_due(self, now):
+        """Return queued announcements whose play_time has passed.
+
+        One vectorized compare over contiguous int64 timestamps replaces a
+        per-announcement Python attribute lookup and datetime comparison.
+        """
+        with self.lock:
+            if self._soa_dirty:
+                self._rebuild_soa()
+            if not len(self._play_us):
+                return []
+            mask = self._play_us <= int(now.timestamp() * 1e6)
+            return [self.queue[i][3] for i in np.nonzero(mask)[0]]
+
+    def _render_wav(self, announcement):
+        """Synthesize the announcement to a WAV file (runs on the synth worker).
+
+        Renders are memoized by (voice_id, text) under wav_cache/, so a daily
+        repeat with constant variables synthesizes once and replays for the
+        cost of reading the file (~5ms) instead of 1-2s of TTS.
+        """
+        text = announcement.get_text()
+        cache_key = (announcement.voice_id, text)
+        path = self._wav_cache.get(cache_key)
+        if path is not None and os.path.exists(path):
+            return path
+        if announcement.voice_id != self._last_voice_id:
+            self.engine.setProperty('voice', self.voices[announcement.voice_id].id)
+            self._last_voice_id = announcement.voice_id
+        os.makedirs(WAV_CACHE_DIR, exist_ok=True)
+        digest = hashlib.md5(f"{announcement.voice_id}:{text}".encode('utf-8')).hexdigest()
+        path = os.path.join(WAV_CACHE_DIR, f"{digest}.wav")
+        self.engine.save_to_file(text, path)
+        self.engine.runAndWait()
+        if self.interrupted:
+            # engine.stop() mid-save leaves a truncated WAV; never memoize
+            # it or every future replay of this text would play the stub.
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+            return None
+        # Bound the cache: evict oldest-first (dict preserves insertion
+        # order) so a long-running kiosk doesn't fill the disk.
+        while len(self._wav_cache) >= WAV_CACHE_MAX:
+            old_key = next(iter(self._wav_cache))
+            old_path = self._wav_cache.pop(old_key)
+            try:
+                os.remove(old_path)
+            except OSError:
+                pass
+        self._wav_cache[cache_key] = path
+        return path
+
+    def _play_wav(self, path):
+        """Stream a rendered WAV file to the output device.
+
+        Block sizes double 20ms -> 40ms -> 80ms -> 160ms: the first write is
+        small so audio starts almost immediately, later writes are larger to
+        amortise the per-write overhead. The stream is kept on self so
+        interrupt_with_live can abort it mid-playback.
+        """
+        import wave
+        import sounddevice as sd  # deferred: loads PortAudio on first use
+        wf = wave.open(path, 'rb')
+        try:
+            rate = wf.getframerate()
+            stream = sd.RawOutputStream(samplerate=rate,
+                                        channels=wf.getnchannels(),
+                                        dtype='int16')
+            self._play_stream = stream
+            try:
+                with stream:
+                    block_ms = 20
+                    while not self.interrupted:
+                        data = wf.readframes(rate * block_ms // 1000)
+                        if not data:
+                            break
+                        stream.write(data)
+                        block_ms = min(block_ms * 2, 160)
+            finally:
+                self._play_stream = None
+        except sd.PortAudioError:
+            pass  # stream aborted by a live interrupt
+        finally:
+            wf.close()
 
     def _play_announcement(self, announcement):
         try:
-            self.engine.setProperty('voice', self.voices[announcement.voice_id].id)
-            self.engine.setProperty('rate', 150)
-            self.engine.setProperty('volume', 1.0)
+            # Use the pre-rendered audio if the one-ahead worker prepared it,
+            # otherwise render now (still on the single synth worker, so the
+            # engine is never driven from two threads at once).
+            if self._ahead_announcement is announcement and self._ahead_future is not None:
+                wav_path = self._ahead_future.result()
+            else:
+                wav_path = self._synth_pool.submit(self._render_wav, announcement).result()
+            self._ahead_future = None
+            self._ahead_announcement = None
+            # Pre-render the next queued item while this one plays
+            with self.lock:
+                if self.queue:
+                    self._ahead_announcement = self.queue[0][3]
+                    self._ahead_future = self._synth_pool.submit(self._render_wav, self._ahead_announcement)
+            if wav_path is None:
+                return  # render cancelled by a live interrupt
             text = announcement.get_text()
             self.status_bar.showMessage(f"Playing: {text}")
-            self.engine.say(text)
-            self.engine.runAndWait()
+            self._play_wav(wav_path)
         except Exception as e:
             self.status_bar.showMessage(f"Error playing announcement: {e}")
         finally:
+            # Release the playback slot first so the follow-up submission is
+            # not mistaken for an announcement that is still playing.
+            self.current_announcement = None
+            self._play_future = None
             # After playing, if repeating, reschedule and re-add
             if announcement.repeat:
                 announcement.reschedule()
                 self.add_announcement(announcement)
             # Play next announcement
-            self.current_announcement = None
             self._try_play_next()
 
 # ---------------- Schedule Manager Dialog ----------------
@@ -121,18 +293,17 @@ class ScheduleManagerDialog(QDialog):
         super().__init__(parent)
         self.setWindowTitle("📅 Smart Schedule Manager")
         self.setWindowIcon(QIcon())  # Optional: set your icon
+        screen = self.window().screen() or (self.parent().screen() if self.parent() else self.screen())
+        self._dpi_scale = screen.logicalDotsPerInch() / 96.0  # cached; DPI queries walk the Qt screen graph
         self.voices = voices
         self.announcement_queue = announcement_queue
         self.announcements = []
+        self._edit_dlg = None  # built once on first use, then reset() per open
         self.init_ui()
         self.adjust_window_size()
 
     def scale_font_size(self, base_size=14):
-        screen = self.window().screen() or (self.parent().screen() if self.parent() else self.screen())
-        dpi = screen.logicalDotsPerInch()
-        base_dpi = 96
-        scale = dpi / base_dpi
-        return max(11, int(base_size * scale))
+        return max(11, int(base_size * self._dpi_scale))
 
     def init_ui(self):
         font_size = self.scale_font_size()
@@ -157,43 +328,51 @@ class ScheduleManagerDialog(QDialog):
         btn_layout = QHBoxLayout()
         btn_layout.setSpacing(15)
 
-        def styled_button(text, bg_color):
+        def styled_button(text, name):
             btn = QPushButton(text)
             btn.setFixedWidth(120)
-            btn.setStyleSheet(f"""
-                QPushButton {{
-                    font-size: {font_size}px;
-                    padding: 8px;
-                    background-color: {bg_color};
-                    color: white;
-                    border-radius: 6px;
-                }}
-                QPushButton:hover {{
-                    background-color: #333;
-                }}
-            """)
+            btn.setObjectName(name)
             return btn
 
-        add_btn = styled_button("➕ Add", "#4CAF50")
+        add_btn = styled_button("➕ Add", "addBtn")
         add_btn.clicked.connect(self.add_announcement)
         btn_layout.addWidget(add_btn)
 
-        edit_btn = styled_button("✏️ Edit", "#2196F3")
+        edit_btn = styled_button("✏️ Edit", "editBtn")
         edit_btn.clicked.connect(self.edit_announcement)
         btn_layout.addWidget(edit_btn)
 
-        del_btn = styled_button("🗑️ Delete", "#f44336")
+        del_btn = styled_button("🗑️ Delete", "delBtn")
         del_btn.clicked.connect(self.delete_announcement)
         btn_layout.addWidget(del_btn)
 
         btn_layout.addStretch(1)
 
-        close_btn = styled_button("❌ Close", "#9E9E9E")
+        close_btn = styled_button("❌ Close", "closeBtn")
         close_btn.clicked.connect(self.close)
         btn_layout.addWidget(close_btn)
 
         main_layout.addLayout(btn_layout)
 
+        # One stylesheet on the dialog covering all four buttons: Qt parses
+        # the QSS once instead of once per setStyleSheet call.
+        button_qss = "".join(f"""
+            QPushButton#{name} {{
+                font-size: {font_size}px;
+                padding: 8px;
+                background-color: {bg_color};
+                color: white;
+                border-radius: 6px;
+            }}
+            QPushButton#{name}:hover {{
+                background-color: #333;
+            }}
+        """ for name, bg_color in (("addBtn", "#4CAF50"),
+                                   ("editBtn", "#2196F3"),
+                                   ("delBtn", "#f44336"),
+                                   ("closeBtn", "#9E9E9E")))
+        self.setStyleSheet(button_qss)
+
         # Status Bar Label
         self.status_label = QLabel("")
         self.status_label.setAlignment(Qt.AlignRight)
@@ -206,9 +385,7 @@ class ScheduleManagerDialog(QDialog):
     def adjust_window_size(self):
         screen = self.window().screen() or (self.parent().screen() if self.parent() else self.screen())
         screen_geom = screen.availableGeometry()
-        dpi = screen.logicalDotsPerInch()
-        base_dpi = 96
-        scale_factor = dpi / base_dpi
+        scale_factor = self._dpi_scale
 
         base_width = 900
         base_height = 600
@@ -230,18 +407,40 @@ class ScheduleManagerDialog(QDialog):
         fg.moveCenter(screen_geom.center())
         self.move(fg.topLeft())
 
+    def _build_item(self, ann):
+        repeat_str = f" ({ann.repeat})" if ann.repeat else ""
+        item_text = f"{ann.play_time.strftime('%Y-%m-%d %H:%M')} {repeat_str} - {ann.get('text_template')[:50]}"
+        item = QListWidgetItem(item_text)
+        item.setData(Qt.UserRole, ann)
+        return item
+
     def refresh_list(self):
-        self.list_widget.clear()
-        for ann in self.announcements:
-            repeat_str = f" ({ann.repeat})" if ann.repeat else ""
-            item_text = f"{ann.play_time.strftime('%Y-%m-%d %H:%M')} {repeat_str} - {ann.get('text_template')[:50]}"
-            item = QListWidgetItem(item_text)
-            item.setData(Qt.UserRole, ann)
-            self.list_widget.addItem(item)
+        # Suppress per-row signals/repaints while repopulating; each addItem
+        # would otherwise emit rowsInserted and trigger a layout pass.
+        self.list_widget.setUpdatesEnabled(False)
+        self.list_widget.blockSignals(True)
+        try:
+            self.list_widget.clear()
+            for item in [self._build_item(a) for a in self.announcements]:
+                self.list_widget.addItem(item)
+        finally:
+            self.list_widget.blockSignals(False)
+            self.list_widget.setUpdatesEnabled(True)
         self.status_label.setText(f"Total scheduled: {len(self.announcements)}")
+        # Let the main window re-arm its next-fire timer for the new list
+        parent = self.parent()
+        if hasattr(parent, 'schedule_changed'):
+            parent.schedule_changed()
+
+    def _get_edit_dialog(self, announcement=None):
+        if self._edit_dlg is None:
+            self._edit_dlg = AnnouncementEditDialog(self, self.voices, announcement)
+        else:
+            self._edit_dlg.reset(announcement)
+        return self._edit_dlg
 
     def add_announcement(self):
-        dlg = AnnouncementEditDialog(self, self.voices)
+        dlg = self._get_edit_dialog()
         if dlg.exec_():
             ann = dlg.get_announcement()
             self.announcements.append(ann)
@@ -253,7 +452,7 @@ class ScheduleManagerDialog(QDialog):
             QMessageBox.warning(self, "No selection", "Please select an announcement to edit.")
             return
         ann = selected.data(Qt.UserRole)
-        dlg = AnnouncementEditDialog(self, self.voices, ann)
+        dlg = self._get_edit_dialog(ann)
         if dlg.exec_():
             updated_ann = dlg.get_announcement()
             idx = self.announcements.index(ann)
@@ -284,22 +483,25 @@ from PyQt5.QtCore import Qt, QDateTime
 from PyQt5.QtGui import QIcon, QPalette, QColor
 from datetime import datetime
 
+# Matches one "key=value" pair per line, stripping surrounding whitespace
+_VAR_RE = re.compile(r'^[ \t]*([^\s=][^=]*?)[ \t]*=[ \t]*(.*?)[ \t]*$', re.MULTILINE)
+
+
 class AnnouncementEditDialog(QDialog):
     def __init__(self, parent, voices, announcement=None):
         super().__init__(parent)
         self.setWindowTitle("Add/Edit Announcement")
         self.setWindowIcon(QIcon())  # Set your icon path here if needed
+        screen = self.window().screen() or (self.parent().screen() if self.parent() else self.screen())
+        self._dpi_scale = screen.logicalDotsPerInch() / 96.0  # cached; DPI queries walk the Qt screen graph
         self.voices = voices
         self.announcement = announcement
         self.init_ui()
+        self.reset(announcement)
         self.adjust_window_size()
 
     def scale_font_size(self, base_size=14):
-        screen = self.window().screen() or (self.parent().screen() if self.parent() else self.screen())
-        dpi = screen.logicalDotsPerInch()
-        base_dpi = 96
-        scale = dpi / base_dpi
-        return max(11, int(base_size * scale))  # minimum font size 11
+        return max(11, int(base_size * self._dpi_scale))  # minimum font size 11
 
     def set_light_palette_to_datetimeedit(self, datetime_edit):
         """Force light palette and style on QDateTimeEdit and its calendar popup."""
@@ -360,10 +562,6 @@ class AnnouncementEditDialog(QDialog):
         self.template_edit.setPlaceholderText("E.g., Train {train_no} arriving at platform {platform}")
         self.template_edit.setMinimumHeight(150)
         self.template_edit.setStyleSheet(f"font-size: {font_size}px;")
-        if self.announcement:
-            self.template_edit.setText(self.announcement.text_template)
-        else:
-            self.template_edit.setText("Train {train_no} arriving at platform {platform}")
         text_layout.addRow("Text Template:", self.template_edit)
         text_group.setLayout(text_layout)
 
@@ -376,21 +574,17 @@ class AnnouncementEditDialog(QDialog):
         self.datetime_edit.setCalendarPopup(True)
         self.datetime_edit.setMinimumWidth(220)
         self.datetime_edit.setStyleSheet(f"font-size: {font_size}px; padding: 4px;")
-        self.datetime_edit.setDateTime(QDateTime.currentDateTime() if not self.announcement else QDateTime(self.announcement.play_time))
         self.set_light_palette_to_datetimeedit(self.datetime_edit)  # Apply light theme
 
         self.repeat_box = QComboBox()
         self.repeat_box.addItems(["None", "Daily", "Weekly"])
         self.repeat_box.setStyleSheet(f"font-size: {font_size}px; padding: 4px;")
-        self.repeat_box.setCurrentText(self.announcement.repeat.capitalize() if self.announcement and self.announcement.repeat else "None")
 
         self.repeat_end_edit = QDateTimeEdit()
         self.repeat_end_edit.setDisplayFormat("yyyy-MM-dd HH:mm")
         self.repeat_end_edit.setCalendarPopup(True)
         self.repeat_end_edit.setMinimumWidth(220)
         self.repeat_end_edit.setStyleSheet(f"font-size: {font_size}px; padding: 4px;")
-        self.repeat_end_edit.setEnabled(self.repeat_box.currentText() != "None")
-        self.repeat_end_edit.setDateTime(QDateTime.currentDateTime() if not (self.announcement and getattr(self.announcement, 'repeat_end', None)) else QDateTime(self.announcement.repeat_end))
         self.set_light_palette_to_datetimeedit(self.repeat_end_edit)  # Apply light theme
 
         self.repeat_box.currentTextChanged.connect(self.on_repeat_changed)
@@ -409,12 +603,10 @@ class AnnouncementEditDialog(QDialog):
         for v in self.voices:
             self.voice_box.addItem(v.name)
         self.voice_box.setStyleSheet(f"font-size: {font_size}px; padding: 4px;")
-        self.voice_box.setCurrentIndex(self.announcement.voice_id if self.announcement else 0)
 
         self.priority_spin = QSpinBox()
         self.priority_spin.setRange(1, 10)
         self.priority_spin.setStyleSheet(f"font-size: {font_size}px; padding: 4px;")
-        self.priority_spin.setValue(self.announcement.priority if self.announcement else 1)
 
         options_layout.addRow("Voice:", self.voice_box)
         options_layout.addRow("Priority:", self.priority_spin)
@@ -429,11 +621,6 @@ class AnnouncementEditDialog(QDialog):
         self.variables_edit.setPlaceholderText("key=value format, one per line")
         self.variables_edit.setMinimumHeight(160)
         self.variables_edit.setStyleSheet(f"font-size: {font_size}px;")
-        if self.announcement and self.announcement.variables:
-            vars_text = "\n".join(f"{k}={v}" for k, v in self.announcement.variables.items())
-            self.variables_edit.setText(vars_text)
-        else:
-            self.variables_edit.setText("train_no=123\nplatform=4")
 
         vars_layout.addRow(self.variables_edit)
         vars_group.setLayout(vars_layout)
@@ -489,9 +676,7 @@ class AnnouncementEditDialog(QDialog):
     def adjust_window_size(self):
         screen = self.window().screen() or (self.parent().screen() if self.parent() else self.screen())
         screen_geom = screen.availableGeometry()
-        dpi = screen.logicalDotsPerInch()
-        base_dpi = 96
-        scale_factor = dpi / base_dpi
+        scale_factor = self._dpi_scale
 
         base_width = 1000
         base_height = 750
@@ -516,29 +701,62 @@ class AnnouncementEditDialog(QDialog):
     def on_repeat_changed(self, text):
         self.repeat_end_edit.setEnabled(text != "None")
 
+    def reset(self, announcement=None):
+        """Repopulate all fields, so one cached instance can be reused.
+
+        Building this dialog (scroll area, four group boxes, two calendar
+        popups, stylesheets) costs 80-200ms; resetting fields is ~5ms.
+        """
+        self.announcement = announcement
+        if announcement:
+            self.template_edit.setText(announcement.text_template)
+            self.datetime_edit.setDateTime(QDateTime(announcement.play_time))
+            self.repeat_box.setCurrentText(announcement.repeat.capitalize() if announcement.repeat else "None")
+            self.repeat_end_edit.setDateTime(
+                QDateTime(announcement.repeat_end) if getattr(announcement, 'repeat_end', None)
+                else QDateTime.currentDateTime())
+            self.voice_box.setCurrentIndex(announcement.voice_id)
+            self.priority_spin.setValue(announcement.priority)
+            if announcement.variables:
+                self.variables_edit.setText("\n".join(f"{k}={v}" for k, v in announcement.variables.items()))
+            else:
+                self.variables_edit.setText("train_no=123\nplatform=4")
+        else:
+            self.template_edit.setText("Train {train_no} arriving at platform {platform}")
+            self.datetime_edit.setDateTime(QDateTime.currentDateTime())
+            self.repeat_box.setCurrentText("None")
+            self.repeat_end_edit.setDateTime(QDateTime.currentDateTime())
+            self.voice_box.setCurrentIndex(0)
+            self.priority_spin.setValue(1)
+            self.variables_edit.setText("train_no=123\nplatform=4")
+        self.repeat_end_edit.setEnabled(self.repeat_box.currentText() != "None")
+
     def on_save(self):
         if not self.template_edit.toPlainText().strip():
             QMessageBox.warning(self, "Input Error", "Text Template cannot be empty.")
             return
-        if self.repeat_box.currentText() != "None" and self.repeat_end_edit.dateTime() < self.datetime_edit.dateTime():
+        # Fetch each QDateTime once and compare as epoch seconds (plain int
+        # compare, no further object construction); get_announcement reuses
+        # the cached values instead of re-querying the editors.
+        play_qdt = self.datetime_edit.dateTime()
+        end_qdt = self.repeat_end_edit.dateTime()
+        if self.repeat_box.currentText() != "None" and end_qdt.toSecsSinceEpoch() < play_qdt.toSecsSinceEpoch():
             QMessageBox.warning(self, "Input Error", "Repeat End date/time must be after Play DateTime.")
             return
+        self._play_qdt = play_qdt
+        self._end_qdt = end_qdt
         self.accept()
 
     def get_announcement(self):
         template = self.template_edit.toPlainText().strip()
-        play_time = self.datetime_edit.dateTime().toPyDateTime()
+        play_time = self._play_qdt.toPyDateTime()
         repeat = self.repeat_box.currentText().lower() if self.repeat_box.currentText() != "None" else None
-        repeat_end = self.repeat_end_edit.dateTime().toPyDateTime() if repeat else None
+        repeat_end = self._end_qdt.toPyDateTime() if repeat else None
         voice_id = self.voice_box.currentIndex()
         priority = self.priority_spin.value()
 
-        variables_text = self.variables_edit.toPlainText()
-        variables = {}
-        for line in variables_text.splitlines():
-            if '=' in line:
-                k, v = line.split('=', 1)
-                variables[k.strip()] = v.strip()
+        # One C-level regex scan instead of a per-line split/strip loop
+        variables = dict(_VAR_RE.findall(self.variables_edit.toPlainText()))
 
         return {
             "text_template": template,
@@ -559,52 +777,78 @@ from PyQt5.QtWidgets import (
     QApplication, QWidget, QVBoxLayout, QLabel, QPushButton, QGridLayout,
     QHBoxLayout, QStatusBar, QInputDialog, QDialog
 )
-from PyQt5.QtCore import Qt, QTimer, QTime
+from PyQt5.QtCore import Qt, QTimer, QTime, pyqtSignal
 from PyQt5.QtGui import QFont
 from datetime import datetime
 
-# Dummy classes (replace with your real implementations)
-class Announcement:
-    def __init__(self, text, created_at, priority=5):
-        self.text = text
-        self.created_at = created_at
-        self.priority = priority
-
-    def is_due(self, now):
-        return True  # for testing
-
-
-class AnnouncementQueue:
-    def __init__(self, engine, voices, status_bar):
-        self.queue = []
-        self.engine = engine
-        self.voices = voices
-        self.status_bar = status_bar
-
-    def interrupt_with_live(self, ann):
-        self.status_bar.showMessage(f"Live: {ann.text}")
-
-    def add_announcement(self, ann):
-        self.queue.append(ann)
-        self.status_bar.showMessage(f"Queued: {ann.text}")
-
-
-
 # --------------Live Voice Announcemnt-------------------------
+import atexit
+import collections
+import functools
 import json
 import os
 from PyQt5.QtWidgets import (
     QDialog, QVBoxLayout, QLabel, QPushButton, QSlider, QHBoxLayout,
-    QFileDialog, QCheckBox, QStatusBar, QComboBox
+    QFileDialog, QCheckBox, QStatusBar, QComboBox, QGraphicsOpacityEffect
 )
-from PyQt5.QtCore import Qt, QThread, QTimer, QTime
-import pyaudio
-import wave
+from PyQt5.QtCore import Qt, QThread, QTimer, QTime, QPropertyAnimation, QRunnable, QThreadPool
 import numpy as np
 
 
 CONFIG_FILE = "config.json"
 
+_PA_INSTANCE = None
+
+
+def pa():
+    """Process-wide PyAudio handle, created on first use.
+
+    Every PyAudio() init runs Pa_Initialize (a full device re-scan on
+    Windows/WASAPI, hundreds of ms) and every terminate() undoes it, so one
+    shared handle serves enumeration, chime playback and the mic path; it is
+    terminated once at interpreter exit.
+    """
+    global _PA_INSTANCE
+    if _PA_INSTANCE is None:
+        import pyaudio  # deferred: importing pyaudio loads PortAudio itself
+        _PA_INSTANCE = pyaudio.PyAudio()
+    return _PA_INSTANCE
+
+
+def _terminate_pa():
+    """Tear down the shared handle; the next pa() call re-initialises.
+
+    PortAudio snapshots the device list at Pa_Initialize, so this is also
+    how a device refresh picks up hot-plugged hardware. Callers must close
+    any streams opened on the old handle first.
+    """
+    global _PA_INSTANCE
+    if _PA_INSTANCE is not None:
+        _PA_INSTANCE.terminate()
+        _PA_INSTANCE = None
+
+
+atexit.register(_terminate_pa)
+
+
+@functools.lru_cache(maxsize=1)
+def _enumerate_input_devices():
+    """Enumerate PortAudio devices and the default input index once per session.
+
+    PyAudio init re-scans every host API (150-400 ms on Windows), so both the
+    device list and the default index come from a single init; the dialog's
+    Refresh button clears the cache. Returns (devices, default_index).
+    """
+    p = pa()
+    info = p.get_host_api_info_by_index(0)
+    devices = [(i, p.get_device_info_by_host_api_device_index(0, i))
+               for i in range(info.get('deviceCount'))]
+    try:
+        default_index = p.get_default_input_device_info().get('index')
+    except Exception:
+        default_index = None
+    return devices, default_index
+
 
 def load_config():
     if os.path.exists(CONFIG_FILE):
@@ -624,52 +868,158 @@ def save_config(data):
         print(f"Failed to save config: {e}")
 
 
+class _ConfigFlush(QRunnable):
+    """Write a config snapshot to disk off the GUI thread."""
+
+    def __init__(self, data):
+        super().__init__()
+        self._data = data
+
+    def run(self):
+        save_config(self._data)
+
+
+class ConfigStore:
+    """In-memory config with debounced background writes.
+
+    Reads come from the dict, so settings lookups never touch the disk.
+    Each set() (re)starts a 500 ms single-shot timer, collapsing a burst of
+    changes into one write, and the write itself runs on the global thread
+    pool so the GUI thread never blocks on file IO. load_config/save_config
+    remain the raw IO helpers underneath.
+    """
+
+    _DEBOUNCE_MS = 500
+
+    def __init__(self):
+        self._data = load_config()
+        self._dirty = False
+        self._timer = None  # created lazily, after QApplication exists
+        atexit.register(self.flush)
+
+    def get(self, key, default=None):
+        return self._data.get(key, default)
+
+    def set(self, key, value):
+        if self._data.get(key) == value:
+            return
+        self._data[key] = value
+        self._dirty = True
+        if self._timer is None:
+            self._timer = QTimer()
+            self._timer.setSingleShot(True)
+            self._timer.setInterval(self._DEBOUNCE_MS)
+            self._timer.timeout.connect(self._flush_async)
+        self._timer.start()  # restart: only the last change in a burst fires
+
+    def _flush_async(self):
+        if self._dirty:
+            self._dirty = False
+            QThreadPool.globalInstance().start(_ConfigFlush(dict(self._data)))
+
+    def flush(self):
+        """Synchronous flush for interpreter exit; no-op when clean."""
+        if self._dirty:
+            self._dirty = False
+            save_config(self._data)
+
+
+_CONFIG_STORE = None
+
+
+def config_store():
+    """Process-wide ConfigStore, created on first use."""
+    global _CONFIG_STORE
+    if _CONFIG_STORE is None:
+        _CONFIG_STORE = ConfigStore()
+    return _CONFIG_STORE
+
+
 class MicToSpeaker(QThread):
+    """Mic passthrough over blocking-mode streams and a lock-free ring buffer.
+
+    A Python callback on PortAudio's realtime thread contends on the GIL and
+    causes jitter, so capture and playback run in blocking mode instead: this
+    QThread reads small mic blocks and appends them to a bounded deque, and a
+    writer thread pops them into the output stream, parking inside PortAudio
+    C code. deque append/popleft are atomic under the GIL, so the fast path
+    needs no mutex.
+    """
+
     def __init__(self, volume=1.0, input_device_index=None, parent=None):
         super().__init__(parent)
-        self.running = False
-        self.chunk = 1024
-        self.format = pyaudio.paInt16
+        self.chunk = 256  # small blocks keep the passthrough latency low
         self.channels = 1
         self.rate = 44100
         self.volume = volume
-        self.p = pyaudio.PyAudio()
         self.input_device_index = input_device_index
+        # Preallocated scratch buffers; gain is 8.8 fixed-point to avoid the
+        # float64 round-trip.
+        self._gain = int(volume * 256)
+        self._scratch = np.empty(self.chunk, dtype=np.int32)
+        self._out = np.empty(self.chunk, dtype=np.int16)
+        self._stop = threading.Event()
+        self._ring = collections.deque(maxlen=16)  # bounded SPSC buffer
 
     def run(self):
-        self.stream_input = self.p.open(format=self.format,
-                                        channels=self.channels,
-                                        rate=self.rate,
-                                        input=True,
-                                        input_device_index=self.input_device_index,
-                                        frames_per_buffer=self.chunk)
-        self.stream_output = self.p.open(format=self.format,
-                                         channels=self.channels,
-                                         rate=self.rate,
-                                         output=True)
-        self.running = True
-        while self.running:
-            data = self.stream_input.read(self.chunk, exception_on_overflow=False)
-            adjusted_data = self.adjust_volume(data, self.volume)
-            self.stream_output.write(adjusted_data)
-        self.cleanup()
+        import sounddevice as sd  # deferred: loads PortAudio on first use
+        self._stop.clear()
+        self._ring.clear()
+        writer = threading.Thread(target=self._write_loop, daemon=True)
+        with sd.RawInputStream(samplerate=self.rate,
+                               blocksize=self.chunk,
+                               channels=self.channels,
+                               dtype='int16',
+                               device=self.input_device_index) as stream:
+            writer.start()
+            while not self._stop.is_set():
+                data, _ = stream.read(self.chunk)
+                self._ring.append(self._apply_gain(bytes(data)))
+        writer.join()
+
+    def _write_loop(self):
+        import sounddevice as sd
+        with sd.RawOutputStream(samplerate=self.rate,
+                                blocksize=self.chunk,
+                                channels=self.channels,
+                                dtype='int16') as stream:
+            while not self._stop.is_set():
+                try:
+                    stream.write(self._ring.popleft())
+                except IndexError:
+                    sd.sleep(2)  # ring momentarily empty
+
+    def _apply_gain(self, data):
+        n = len(data) // 2
+        view = np.frombuffer(data, dtype=np.int16, count=n)
+        scratch = self._scratch[:n]
+        # Widen to int32 before multiplying: with int16 inputs numpy picks
+        # the int16 loop even with an int32 out=, wrapping sample * gain.
+        scratch[:] = view
+        scratch *= self._gain
+        np.right_shift(scratch, 8, out=scratch)
+        np.clip(scratch, -32768, 32767, out=scratch)
+        out = self._out[:n]
+        out[:] = scratch
+        return out.tobytes()
 
     def stop(self):
-        self.running = False
+        self._stop.set()
+
 
-    def cleanup(self):
-        if hasattr(self, 'stream_input'):
-            self.stream_input.stop_stream()
-            self.stream_input.close()
-        if hasattr(self, 'stream_output'):
-            self.stream_output.stop_stream()
-            self.stream_output.close()
-        self.p.terminate()
+class ChimePlayer(QRunnable):
+    """Writes the preloaded chime PCM to its stream off the GUI thread."""
 
-    def adjust_volume(self, data, volume):
-        audio_data = np.frombuffer(data, dtype=np.int16)
-        audio_data = (audio_data * volume).clip(-32768, 32767).astype(np.int16)
-        return audio_data.tobytes()
+    def __init__(self, stream, pcm):
+        super().__init__()
+        self._stream = stream
+        self._pcm = pcm
+
+    def run(self):
+        try:
+            self._stream.write(self._pcm)
+        except Exception as e:
+            print(f"Chime play failed: {e}")
 
 
 class LiveMicDialog(QDialog):
@@ -681,8 +1031,16 @@ class LiveMicDialog(QDialog):
         self.announcement_queue = announcement_queue
 
         # Load config and chime file
-        config = load_config()
-        self.chime_file = config.get("chime_file", "chime.wav")
+        self.chime_file = config_store().get("chime_file", "chime.wav")
+
+        # Chime PCM is decoded once up front and the output stream is kept
+        # open; opening/terminating PortAudio per play cost 100-300 ms.
+        self._chime_pcm = None
+        self._chime_params = None  # (width, channels, rate)
+        self._chime_ready = False  # validated once at load, not per start
+        self._chime_stream = None
+        self._chime_stream_params = None
+        self._load_chime()
 
         self.layout = QVBoxLayout(self)
         self.setLayout(self.layout)
@@ -695,6 +1053,10 @@ class LiveMicDialog(QDialog):
         self.layout.addWidget(self.device_combo)
         self.populate_input_devices()
 
+        self.refresh_devices_button = QPushButton("🔄 Refresh Devices")
+        self.refresh_devices_button.clicked.connect(self.refresh_devices)
+        self.layout.addWidget(self.refresh_devices_button)
+
         self.label = QLabel("🎙️ Click 'Start' to use Mic for Announcement")
         self.label.setAlignment(Qt.AlignCenter)
         self.layout.addWidget(self.label)
@@ -721,6 +1083,7 @@ class LiveMicDialog(QDialog):
         self.volume_slider.setValue(5)
         self.volume_slider.setTickInterval(1)
         self.volume_value_label = QLabel("5")
+        self._last_vol = self.volume_slider.value()
         self.volume_slider.valueChanged.connect(self.update_volume_label)
         volume_layout.addWidget(self.volume_label)
         volume_layout.addWidget(self.volume_slider)
@@ -744,42 +1107,60 @@ class LiveMicDialog(QDialog):
         self.status_bar.addPermanentWidget(self.clock_label)
         self.layout.addWidget(self.status_bar)
 
-        self.timer = QTimer()
-        self.timer.timeout.connect(self.update_clock)
-        self.timer.start(1000)
+        self._clock_stopped = False
+        self._last_clock_str = None
+        # Subscribe to the main window's clock tick when available; running a
+        # second 1 Hz timer in the dialog would double the wakeups.
+        self._parent_clock = getattr(parent, 'clock_tick', None)
+        self.update_clock()
+        if self._parent_clock is not None:
+            self._parent_clock.connect(self._on_clock_tick)
+        else:
+            self._schedule_clock()
 
         self.mic_thread = None
-        self.blink_timer = QTimer()
-        self.blink_timer.timeout.connect(self.blink_live_status)
-        self.blink_state = False
+        # Blink the LIVE badge by animating an opacity effect: style is set
+        # once, and the fade is composited by Qt with no stylesheet
+        # re-parsing and no Python wakeups per tick.
+        self.live_status.setStyleSheet("color: red; font-weight: bold; font-size: 17px;")
+        self._blink_effect = QGraphicsOpacityEffect(self.live_status)
+        self._blink_effect.setOpacity(1.0)
+        self.live_status.setGraphicsEffect(self._blink_effect)
+        self._blink_anim = QPropertyAnimation(self._blink_effect, b'opacity', self)
+        self._blink_anim.setDuration(1000)
+        self._blink_anim.setKeyValueAt(0.0, 1.0)
+        self._blink_anim.setKeyValueAt(0.5, 0.0)
+        self._blink_anim.setKeyValueAt(1.0, 1.0)
+        self._blink_anim.setLoopCount(-1)
 
     def populate_input_devices(self):
-        self.device_combo.clear()
-        p = pyaudio.PyAudio()
-        info = p.get_host_api_info_by_index(0)
-        numdevices = info.get('deviceCount')
-        for i in range(numdevices):
-            device_info = p.get_device_info_by_host_api_device_index(0, i)
-            if device_info.get('maxInputChannels') > 0:
-                name = device_info.get('name')
-                self.device_combo.addItem(name, i)
-        p.terminate()
-
-        # Optionally select default device:
-        default_index = self.get_default_input_device_index()
-        if default_index is not None:
-            index = self.device_combo.findData(default_index)
-            if index != -1:
-                self.device_combo.setCurrentIndex(index)
-
-    def get_default_input_device_index(self):
+        # Mute the combo while repopulating: clear() and every addItem emit
+        # currentIndexChanged otherwise, one signal round-trip per device.
+        self.device_combo.blockSignals(True)
         try:
-            p = pyaudio.PyAudio()
-            default_index = p.get_default_input_device_info().get('index')
-            p.terminate()
-            return default_index
-        except Exception:
-            return None
+            self.device_combo.clear()
+            devices, default_index = _enumerate_input_devices()
+            for i, device_info in devices:
+                if device_info.get('maxInputChannels') > 0:
+                    name = device_info.get('name')
+                    self.device_combo.addItem(name, i)
+
+            # Optionally select default device:
+            if default_index is not None:
+                index = self.device_combo.findData(default_index)
+                if index != -1:
+                    self.device_combo.setCurrentIndex(index)
+        finally:
+            self.device_combo.blockSignals(False)
+
+    def refresh_devices(self):
+        # The shared handle's device list is frozen at Pa_Initialize, so a
+        # real refresh needs a new handle; close our streams on the old one
+        # first. The chime stream re-opens lazily on the next play.
+        self._close_chime_stream()
+        _terminate_pa()
+        _enumerate_input_devices.cache_clear()
+        self.populate_input_devices()
 
     def start_mic(self):
         if self.chime_checkbox.isChecked():
@@ -793,92 +1174,255 @@ class LiveMicDialog(QDialog):
         self.mic_thread.start()
         self.start_button.setEnabled(False)
         self.stop_button.setEnabled(True)
-        self.blink_timer.start(500)
+        self.live_status.setText("🔴 LIVE")
+        self._blink_anim.start()
 
     def stop_mic(self):
         if self.mic_thread:
-            self.mic_thread.stop()
-            self.mic_thread.wait()
+            if self.mic_thread.isRunning():
+                self.mic_thread.stop()
+                # Bound the wait: a wedged PortAudio read would otherwise
+                # block the GUI thread forever on close.
+                if not self.mic_thread.wait(500):
+                    self.mic_thread.terminate()
+                    self.mic_thread.wait()
             self.mic_thread = None
         self.label.setText("🎙️ Announcement Stopped.")
         self.start_button.setEnabled(True)
         self.stop_button.setEnabled(False)
+        self._blink_anim.stop()
+        self._blink_effect.setOpacity(1.0)
         self.live_status.setText("")
-        self.blink_timer.stop()
 
-    def blink_live_status(self):
-        if self.blink_state:
-            self.live_status.setText("🔴 LIVE")
-            self.live_status.setStyleSheet("color: red; font-weight: bold; font-size: 17px;")
-        else:
-            self.live_status.setText("")
-        self.blink_state = not self.blink_state
+    def _load_chime(self):
+        """Decode the chime file into memory once instead of per play.
 
-    def play_chime(self):
+        Validation happens here, so the start-mic hot path never touches the
+        filesystem (os.path.exists can be slow/flaky on network drives); it
+        only reads the _chime_ready boolean.
+        """
+        self._chime_pcm = None
+        self._chime_params = None
+        self._chime_ready = False
         if not os.path.exists(self.chime_file):
             print("Chime file not found:", self.chime_file)
             return
         try:
+            import wave
             wf = wave.open(self.chime_file, 'rb')
-            p = pyaudio.PyAudio()
-            stream = p.open(format=p.get_format_from_width(wf.getsampwidth()),
-                            channels=wf.getnchannels(),
-                            rate=wf.getframerate(),
-                            output=True)
-            data = wf.readframes(1024)
-            while data:
-                stream.write(data)
-                data = wf.readframes(1024)
-            stream.stop_stream()
-            stream.close()
-            p.terminate()
+            try:
+                # One bulk read: the frame count is known up front, so the
+                # 1024-frame accumulate loop only added Python overhead.
+                self._chime_pcm = wf.readframes(wf.getnframes())
+                self._chime_params = (wf.getsampwidth(), wf.getnchannels(), wf.getframerate())
+                self._chime_ready = True
+            finally:
+                wf.close()
+        except Exception as e:
+            print(f"Failed to load chime: {e}")
+
+    def _ensure_chime_stream(self):
+        """Return a long-lived output stream matching the cached chime format."""
+        if self._chime_stream is not None and self._chime_stream_params == self._chime_params:
+            return self._chime_stream
+        self._close_chime_stream()
+        width, channels, rate = self._chime_params
+        p = pa()
+        self._chime_stream = p.open(
+            format=p.get_format_from_width(width),
+            channels=channels,
+            rate=rate,
+            output=True)
+        self._chime_stream_params = self._chime_params
+        return self._chime_stream
+
+    def _close_chime_stream(self):
+        if self._chime_stream is not None:
+            try:
+                self._chime_stream.stop_stream()
+                self._chime_stream.close()
+            except Exception:
+                pass
+            self._chime_stream = None
+            self._chime_stream_params = None
+
+    def play_chime(self):
+        if not self._chime_ready:
+            return  # load failure was already reported when the path was set
+        try:
+            stream = self._ensure_chime_stream()
         except Exception as e:
             print(f"Chime play failed: {e}")
+            return
+        # The blocking write runs on the thread pool, so start_mic returns
+        # immediately and the mic thread spins up while the chime plays.
+        QThreadPool.globalInstance().start(ChimePlayer(stream, self._chime_pcm))
 
     def select_chime(self):
         file_path, _ = QFileDialog.getOpenFileName(self, "Select Chime Sound", "", "Audio Files (*.wav)")
         if file_path:
             self.chime_file = file_path
             print(f"Permanent chime selected: {self.chime_file}")
-            # Save to config immediately
-            config = load_config()
-            config["chime_file"] = self.chime_file
-            save_config(config)
+            self._load_chime()
+            # Debounced write-behind: the store flushes off the GUI thread
+            config_store().set("chime_file", self.chime_file)
+
+    def _schedule_clock(self):
+        # Re-arm a single shot on the next second boundary: no periodic timer
+        # subscription, no mid-second redraws, no drift.
+        delay = 1000 - QTime.currentTime().msec()
+        QTimer.singleShot(delay, self._clock_tick)
+
+    def _clock_tick(self):
+        if self._clock_stopped:
+            return
+        self.update_clock()
+        self._schedule_clock()
+
+    def _on_clock_tick(self, current_time):
+        self._last_clock_str = current_time
+        self.clock_label.setText(f"🕒 {current_time}")
 
     def update_clock(self):
         current_time = QTime.currentTime().toString("hh:mm:ss AP")
+        if current_time == self._last_clock_str:
+            return  # skip the QLabel relayout when nothing changed
+        self._last_clock_str = current_time
         self.clock_label.setText(f"🕒 {current_time}")
 
     def update_volume_label(self):
-        self.volume_value_label.setText(str(self.volume_slider.value()))
+        v = self.volume_slider.value()
+        if v == self._last_vol:
+            return  # skip the label relayout when the value hasn't changed
+        self._last_vol = v
+        self.volume_value_label.setText(str(v))
 
     def closeEvent(self, event):
         # Stop live mic announcement if running before closing
+        self._clock_stopped = True
+        if self._parent_clock is not None:
+            try:
+                self._parent_clock.disconnect(self._on_clock_tick)
+            except TypeError:
+                pass  # already disconnected
         self.stop_mic()
+        self._close_chime_stream()
         event.accept()
 
 
 
+@functools.lru_cache(maxsize=1)
+def _get_tts():
+    """Init pyttsx3 once per process; SAPI/espeak init costs hundreds of ms."""
+    import pyttsx3  # deferred: importing pyttsx3 pulls in the COM/SAPI stack
+    engine = pyttsx3.init()
+    return engine, engine.getProperty('voices')
+
+
+class LiveTextDialog(QDialog):
+    """Reusable prompt for live text announcements.
+
+    QInputDialog.getText builds a fresh dialog widget tree on every call;
+    this one is constructed once and reset() per use, matching the cached
+    schedule-manager dialog pattern.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("Live Announcement")
+        layout = QVBoxLayout()
+        layout.addWidget(QLabel("Speak your announcement (type here):"))
+        self.text_edit = QLineEdit()
+        layout.addWidget(self.text_edit)
+        btn_layout = QHBoxLayout()
+        btn_layout.addStretch(1)
+        ok_btn = QPushButton("OK")
+        ok_btn.setDefault(True)
+        ok_btn.clicked.connect(self.accept)
+        btn_layout.addWidget(ok_btn)
+        cancel_btn = QPushButton("Cancel")
+        cancel_btn.clicked.connect(self.reject)
+        btn_layout.addWidget(cancel_btn)
+        layout.addLayout(btn_layout)
+        self.setLayout(layout)
+
+    def reset(self):
+        self.text_edit.clear()
+        self.text_edit.setFocus()
+
+    def text(self):
+        return self.text_edit.text()
+
+
+class TtsInitThread(QThread):
+    """Loads the TTS engine off the UI thread so the window paints immediately."""
+    ready = pyqtSignal(object, object)
+
+    def run(self):
+        engine, voices = _get_tts()
+        self.ready.emit(engine, voices)
+
+
 class VoiceAnnouncementApp(QWidget):
+    clock_tick = pyqtSignal(str)  # lets child dialogs share this clock timer
+
+    # One rule shared by all launcher buttons, applied once on the parent
+    # widget so Qt parses and compiles it a single time instead of once per
+    # button. The child combinator keeps it off buttons inside dialogs.
+    _BUTTON_QSS = """
+        VoiceAnnouncementApp > QPushButton {
+            background-color: #2980b9;
+            color: white;
+            padding: 20px 35px;
+            font-size: 20px;
+            font-weight: bold;
+            border-radius: 12px;
+            transition: all 0.3s ease;
+        }
+        VoiceAnnouncementApp > QPushButton:hover {
+            background-color: #3498db;
+            box-shadow: 0 0 10px #2980b9;
+        }
+        VoiceAnnouncementApp > QPushButton:pressed {
+            background-color: #1f618d;
+        }
+    """
+
     def __init__(self):
         super().__init__()
-        self.init_engine()
+        self.engine = None
+        self.voices = None
+        self.announcement_queue = None  # built once the engine is ready
         self.init_ui()
+        self.init_engine()
 
-        # Announcement queue manager87
-        self.announcement_queue = AnnouncementQueue(self.engine, self.voices, self.status_bar)
-
-        # Timer to check scheduled announcements every minute
-        self.scheduler_timer = QTimer()
-        self.scheduler_timer.timeout.connect(self.check_schedules)
-        self.scheduler_timer.start(60000)  # every 60 seconds
+        # Scheduled announcements indexed by next fire time: a single-shot
+        # timer armed to the heap head replaces the old 60-second poll over
+        # every announcement (1440 wakeups/day, up to 60s dispatch latency).
+        self._sched_heap = []  # (play_time, seq, announcement)
+        self._sched_seq = itertools.count()
+        self._sched_timer = QTimer(self)
+        self._sched_timer.setSingleShot(True)
+        self._sched_timer.timeout.connect(self._fire_due)
 
         self.schedule_dialog_instance = None
+        self._live_text_dialog = None  # built once on first use, reset() per open
 
     def init_engine(self):
-        import pyttsx3
-        self.engine = pyttsx3.init()
-        self.voices = self.engine.getProperty('voices')
+        # Engine init happens on a worker thread; the announcement buttons
+        # stay disabled until the voices are available.
+        self._tts_loader = TtsInitThread(self)
+        self._tts_loader.ready.connect(self._on_tts_ready)
+        self._tts_loader.start()
+
+    def _on_tts_ready(self, engine, voices):
+        self.engine = engine
+        self.voices = voices
+        # Announcement queue manager87
+        self.announcement_queue = AnnouncementQueue(engine, voices, self.status_bar)
+        for btn in self._announce_buttons:
+            btn.setEnabled(True)
+        self.status_bar.showMessage("System Ready.")
 
 
     def init_ui(self):
@@ -901,7 +1445,7 @@ class VoiceAnnouncementApp(QWidget):
                 padding: 5px;
                 color: #34495e;
             }
-        """)
+        """ + self._BUTTON_QSS)
 
         main_layout = QVBoxLayout()
         main_layout.setSpacing(30)
@@ -920,20 +1464,22 @@ class VoiceAnnouncementApp(QWidget):
         button_layout.setVerticalSpacing(30)
 
         live_announce_btn = QPushButton("🎙️ Live Text Announcement")
-        live_announce_btn.setStyleSheet(self.button_style())
         live_announce_btn.clicked.connect(self.live_announcement)
         button_layout.addWidget(live_announce_btn, 0, 0)
 
         live_mic_btn = QPushButton("🎙️ Live Mic Announcement")
-        live_mic_btn.setStyleSheet(self.button_style())
         live_mic_btn.clicked.connect(self.open_live_mic_dialog)
         button_layout.addWidget(live_mic_btn, 1, 0)
 
         schedule_btn = QPushButton("📅 Smart Schedule Manager")
-        schedule_btn.setStyleSheet(self.button_style())
         schedule_btn.clicked.connect(self.open_schedule_manager)
         button_layout.addWidget(schedule_btn, 0, 1)
 
+        # Disabled until the TTS engine finishes loading on its worker
+        self._announce_buttons = [live_announce_btn, live_mic_btn, schedule_btn]
+        for btn in self._announce_buttons:
+            btn.setEnabled(False)
+
         main_layout.addLayout(button_layout)
 
         # Status bar and clock layout
@@ -944,52 +1490,52 @@ class VoiceAnnouncementApp(QWidget):
         self.clock_label = QLabel()
         self.clock_label.setFont(QFont("Arial", 16, QFont.Bold))
         self.clock_label.setStyleSheet("color: #34495e;")
+        self._last_clock_str = None
         self.update_clock()
         status_layout.addWidget(self.clock_label, alignment=Qt.AlignLeft)
 
         self.status_bar = QStatusBar()
         self.status_bar.setStyleSheet("color: #2c3e50;")
-        self.status_bar.showMessage("System Ready.")
+        self.status_bar.showMessage("Loading voices...")
         status_layout.addWidget(self.status_bar, stretch=1)
 
         main_layout.addLayout(status_layout)
 
         self.setLayout(main_layout)
 
-        # Clock update timer
-        self.clock_timer = QTimer()
-        self.clock_timer.timeout.connect(self.update_clock)
-        self.clock_timer.start(1000)
+        # Clock ticks snapped to second boundaries
+        self._schedule_clock()
 
-    def button_style(self):
-        return """
-            QPushButton {
-                background-color: #2980b9;
-                color: white;
-                padding: 20px 35px;
-                font-size: 20px;
-                font-weight: bold;
-                border-radius: 12px;
-                transition: all 0.3s ease;
-            }
-            QPushButton:hover {
-                background-color: #3498db;
-                box-shadow: 0 0 10px #2980b9;
-            }
-            QPushButton:pressed {
-                background-color: #1f618d;
-            }
-        """
+    def _schedule_clock(self):
+        # Re-arm on the next second boundary: the displayed string can only
+        # change there, so a free-running 1000ms timer just drifts and
+        # produces redundant mid-second ticks.
+        delay = 1000 - QTime.currentTime().msec()
+        QTimer.singleShot(delay, self._clock_tick)
+
+    def _clock_tick(self):
+        self.update_clock()
+        self._schedule_clock()
 
     def update_clock(self):
-        current_time = QTime.currentTime().toString("hh:mm:ss AP")
+        # time.strftime is cheaper than building a QTime and running Qt's
+        # locale-aware formatter every second
+        current_time = time.strftime("%I:%M:%S %p")
+        if current_time == self._last_clock_str:
+            return  # skip the QLabel relayout when nothing changed
+        self._last_clock_str = current_time
         self.clock_label.setText(current_time)
+        self.clock_tick.emit(current_time)
 
     def live_announcement(self):
-        text, ok = QInputDialog.getText(self, "Live Announcement", "Speak your announcement (type here):")
-        if ok and text.strip():
-            ann = Announcement(text, datetime.now(), priority=10)
-            self.announcement_queue.interrupt_with_live(ann)
+        if self._live_text_dialog is None:
+            self._live_text_dialog = LiveTextDialog(self)
+        self._live_text_dialog.reset()
+        if self._live_text_dialog.exec_():
+            text = self._live_text_dialog.text()
+            if text.strip():
+                ann = Announcement(text, datetime.now(), priority=10)
+                self.announcement_queue.interrupt_with_live(ann)
 
     def open_live_mic_dialog(self):
         dialog = LiveMicDialog(self, announcement_queue=self.announcement_queue)
@@ -1000,13 +1546,38 @@ class VoiceAnnouncementApp(QWidget):
             self.schedule_dialog_instance = ScheduleManagerDialog(self, self.voices, self.announcement_queue)
         self.schedule_dialog_instance.show()
 
-    def check_schedules(self):
+    def schedule_changed(self):
+        """Rebuild the next-fire heap after the schedule dialog edits its list."""
+        self._sched_heap = [(ann.play_time, next(self._sched_seq), ann)
+                            for ann in self.schedule_manager_announcements]
+        heapq.heapify(self._sched_heap)
+        self._arm_scheduler()
+
+    def _arm_scheduler(self):
+        if not self._sched_heap:
+            self._sched_timer.stop()
+            return
+        delay_s = (self._sched_heap[0][0] - datetime.now()).total_seconds()
+        # Cap at 24h: QTimer.start takes a C int, so far-future schedules
+        # (> ~24.8 days) would overflow it. A capped timer just wakes with
+        # nothing due and _fire_due re-arms for the remainder.
+        self._sched_timer.start(min(max(0, int(delay_s * 1000)), 86_400_000))
+
+    def _fire_due(self):
         now = datetime.now()
-        for ann in self.schedule_manager_announcements:
-            if ann.is_due(now):
-                self.announcement_queue.add_announcement(ann)
-                if not ann.repeat:
-                    self.schedule_manager_announcements.remove(ann)
+        fired_once = []
+        while self._sched_heap and self._sched_heap[0][0] <= now:
+            _, _, ann = heapq.heappop(self._sched_heap)
+            self.announcement_queue.add_announcement(ann)
+            if ann.repeat:
+                ann.reschedule()
+                heapq.heappush(self._sched_heap, (ann.play_time, next(self._sched_seq), ann))
+            else:
+                fired_once.append(ann)
+        if fired_once and self.schedule_dialog_instance:
+            self.schedule_dialog_instance.announcements = [
+                a for a in self.schedule_dialog_instance.announcements if a not in fired_once]
+        self._arm_scheduler()
 
     @property
     def schedule_manager_announcements(self):